@@ -21,6 +21,7 @@ Overall, this code provides a flexible and powerful tool for analyzing directed
 """
 
 from fractions import Fraction
+from operator import itemgetter
 from typing import Generic, Mapping, MutableMapping, Tuple, TypeVar
 
 from .neg_cycle import Cycle, Domain, Edge, Node
@@ -30,6 +31,8 @@ Ratio = TypeVar("Ratio", Fraction, float)
 Graph = Mapping[Node, Mapping[Node, Mapping[str, Domain]]]
 GraphMut = MutableMapping[Node, MutableMapping[Node, MutableMapping[str, Domain]]]
 
+_get_cost_time = itemgetter("cost", "time")
+
 
 def set_default(digraph: GraphMut, weight: str, value: Domain) -> None:
     """
@@ -112,8 +115,10 @@ class CycleRatioAPI(ParametricAPI[Node, MutableMapping[str, Domain], Ratio]):
 
         :return: a Ratio object.
         """
-        total_cost = sum(edge["cost"] for edge in cycle)
-        total_time = sum(edge["time"] for edge in cycle)
+        total_cost = total_time = 0
+        for cost, time in map(_get_cost_time, cycle):
+            total_cost += cost
+            total_time += time
         return self.result_type(total_cost) / total_time
 
 
@@ -20,7 +20,7 @@ Overall, this code provides a framework for solving complex network optimization
 
 from abc import abstractmethod
 from fractions import Fraction
-from typing import Generic, Mapping, MutableMapping, Tuple, TypeVar, Callable
+from typing import Callable, Generic, Mapping, MutableMapping, Optional, Tuple, TypeVar
 
 from .neg_cycle_q import Cycle, Edge, NegCycleFinder, Node
 
@@ -93,7 +93,7 @@ class MinParametricSolver(Generic[Node, Edge, Ratio]):
         self,
         dist: MutableMapping[Node, Domain],
         ratio: Ratio,
-        update_ok: Callable[[Domain, Domain], bool],
+        update_ok: Optional[Callable[[Domain, Domain], bool]] = None,
         pick_one_only=False,
     ) -> Tuple[Ratio, Cycle]:
         """
@@ -113,14 +113,16 @@ class MinParametricSolver(Generic[Node, Edge, Ratio]):
 
         :param update_ok: The `update_ok` parameter is a function that determines whether an update to the
             distance `dist[vtx_v]` is allowed. It takes two arguments: the current value of `dist[vtx_v]` and
-            the new value `d`. It should return `True` if the update is
+            the new value `d`. It should return `True` if the update is allowed. If `None`, every improving
+            update is accepted.
 
         :return: The function `run` returns a tuple containing the updated ratio (`ratio`) and the cycle (`cycle`).
         """
         D = type(next(iter(dist.values())))
+        distance = self.omega.distance  # bind once per run
 
         def get_weight(e: Edge) -> Domain:
-            return D(self.omega.distance(ratio, e))
+            return D(distance(ratio, e))
 
         r_max = ratio
         c_max = []
@@ -25,6 +25,7 @@ from typing import (
     List,
     Mapping,
     MutableMapping,
+    Set,
     Tuple,
     TypeVar,
 )
@@ -126,15 +127,52 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
 
         :type get_weight: Callable[[Edge], Domain]
 
+        :return: a boolean value indicating whether any changes were made to the `dist` mapping and `pred` dictionary.
+        """
+        return self._relax_active(dist, get_weight, set())
+
+    def _relax_active(
+        self,
+        dist: MutableMapping[Node, Domain],
+        get_weight: Callable[[Edge], Domain],
+        scanned: Set[Node],
+    ) -> bool:
+        """
+        The `_relax_active` function is the sweep behind `relax`, skipping the nodes in `scanned`.
+
+        Like SPFA, only nodes whose distance has changed since their outgoing edges were last relaxed are
+        scanned; relaxing the edges of any other node cannot change `dist`. With an empty `scanned` this is
+        a full sweep.
+
+        :param dist: `dist` is a mutable mapping that represents the current distances from a source node to
+            all other nodes in a graph. It is a mapping from nodes to their corresponding distances
+
+        :type dist: MutableMapping[Node, Domain]
+
+        :param get_weight: The `get_weight` parameter is a callable function that takes an `Edge` object as
+            input and returns a value of type `Domain`. This function is used to calculate the weight or cost
+            associated with an edge in the graph
+
+        :type get_weight: Callable[[Edge], Domain]
+
+        :param scanned: nodes whose outgoing edges have been relaxed since their distance last changed. It is
+            updated in place and must start empty for each new `dist` or `get_weight`
+
+        :type scanned: Set[Node]
+
         :return: a boolean value indicating whether any changes were made to the `dist` mapping and `pred` dictionary.
         """
         changed = False
         for utx, neighbors in self.digraph.items():
+            if utx in scanned:
+                continue
+            scanned.add(utx)
             for vtx, edge in neighbors.items():
                 distance = dist[utx] + get_weight(edge)
                 if dist[vtx] > distance:
                     dist[vtx] = distance
                     self.pred[vtx] = (utx, edge)
+                    scanned.discard(vtx)
                     changed = True
         return changed
 
@@ -232,8 +270,9 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
             False
         """
         self.pred = {}
+        scanned: Set[Node] = set()
         found = False
-        while not found and self.relax(dist, get_weight):
+        while not found and self._relax_active(dist, get_weight, scanned):
             for vtx in self.find_cycle():
                 # Will zero cycle be found???
                 assert self.is_negative(vtx, dist, get_weight)
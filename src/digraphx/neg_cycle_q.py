@@ -29,6 +29,8 @@ from typing import (
     List,
     Mapping,
     MutableMapping,
+    Optional,
+    Set,
     Tuple,
     TypeVar,
 )
@@ -109,7 +111,7 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         self,
         dist: MutableMapping[Node, Domain],
         get_weight: Callable[[Edge], Domain],
-        update_ok: Callable[[Domain, Domain], bool],
+        update_ok: Optional[Callable[[Domain, Domain], bool]] = None,
     ) -> bool:
         """
         The `relax_pred` function updates the `dist` and `pred` dictionaries based on the current distances and
@@ -128,25 +130,72 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
 
         :param update_ok: The `update_ok` parameter is a function that determines whether an update to the
             distance `dist[vtx_v]` is allowed. It takes two arguments: the current value of `dist[vtx_v]` and
-            the new value `d`. It should return `True` if the update is
+            the new value `d`. It should return `True` if the update is allowed. If `None`, every improving
+            update is accepted.
+
+        :return: a boolean value indicating whether any changes were made to the `dist` mapping and `pred` dictionary.
+        """
+        return self._relax_pred_active(dist, get_weight, update_ok, set())
+
+    def _relax_pred_active(
+        self,
+        dist: MutableMapping[Node, Domain],
+        get_weight: Callable[[Edge], Domain],
+        update_ok: Optional[Callable[[Domain, Domain], bool]],
+        scanned: Set[Node],
+    ) -> bool:
+        """
+        The `_relax_pred_active` function is the sweep behind `relax_pred`, skipping the nodes in `scanned`.
+
+        Like SPFA, only nodes whose distance has changed since their outgoing edges were last relaxed are
+        scanned. A node with an update rejected by `update_ok` stays active. With an empty `scanned` this
+        is a full sweep.
+
+        :param dist: `dist` is a mutable mapping that represents the current distances from a source node to
+            all other nodes in a graph. It is a mapping from nodes to their corresponding distances
+
+        :type dist: MutableMapping[Node, Domain]
+
+        :param get_weight: The `get_weight` parameter is a callable function that takes an `Edge` object as
+            input and returns a value of type `Domain`. This function is used to calculate the weight or cost
+            associated with an edge in the graph
+
+        :type get_weight: Callable[[Edge], Domain]
+
+        :param update_ok: The `update_ok` parameter is a function that determines whether an update to the
+            distance `dist[vtx_v]` is allowed. It takes two arguments: the current value of `dist[vtx_v]` and
+            the new value `d`. It should return `True` if the update is allowed. If `None`, every improving
+            update is accepted.
+
+        :param scanned: nodes whose outgoing edges have been relaxed since their distance last changed. It is
+            updated in place and must start empty for each new `dist` or `get_weight`
+
+        :type scanned: Set[Node]
 
         :return: a boolean value indicating whether any changes were made to the `dist` mapping and `pred` dictionary.
         """
         changed = False
         for utx, neighbors in self.digraph.items():
+            if utx in scanned:
+                continue
+            scanned.add(utx)
             for vtx, edge in neighbors.items():
                 distance = dist[utx] + get_weight(edge)
-                if dist[vtx] > distance and update_ok(dist[vtx], distance):
-                    dist[vtx] = distance
-                    self.pred[vtx] = (utx, edge)
-                    changed = True
+                if dist[vtx] > distance:
+                    if update_ok is None or update_ok(dist[vtx], distance):
+                        dist[vtx] = distance
+                        self.pred[vtx] = (utx, edge)
+                        scanned.discard(vtx)
+                        changed = True
+                    else:
+                        scanned.discard(utx)
         return changed
 
     def relax_succ(
         self,
         dist: MutableMapping[Node, Domain],
         get_weight: Callable[[Edge], Domain],
-        update_ok: Callable[[Domain, Domain], bool],
+        update_ok: Optional[Callable[[Domain, Domain], bool]] = None,
     ) -> bool:
         """
         The `relax_succ` function updates the `dist` and `succ` dictionaries based on the current distances and
@@ -165,7 +214,8 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
 
         :param update_ok: The `update_ok` parameter is a function that determines whether an update to the
             distance `dist[vtx_v]` is allowed. It takes two arguments: the current value of `dist[vtx_v]` and
-            the new value `d`. It should return `True` if the update is
+            the new value `d`. It should return `True` if the update is allowed. If `None`, every improving
+            update is accepted.
 
         :return: a boolean value indicating whether any changes were made to the `dist` mapping and `pred` dictionary.
         """
@@ -173,7 +223,9 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         for utx, neighbors in self.digraph.items():
             for vtx, edge in neighbors.items():
                 distance = dist[vtx] - get_weight(edge)
-                if dist[utx] < distance and update_ok(dist[utx], distance):
+                if dist[utx] < distance and (
+                    update_ok is None or update_ok(dist[utx], distance)
+                ):
                     dist[utx] = distance
                     self.succ[utx] = (vtx, edge)
                     changed = True
@@ -183,7 +235,7 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         self,
         dist: MutableMapping[Node, Domain],
         get_weight: Callable[[Edge], Domain],
-        update_ok: Callable[[Domain, Domain], bool],
+        update_ok: Optional[Callable[[Domain, Domain], bool]] = None,
     ) -> Generator[Cycle, None, None]:
         """
         The `howard_pred` function finds negative cycles in a graph and yields a list of cycles.
@@ -201,7 +253,7 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         :param update_ok: The `update_ok` parameter is a callable function that determines whether an update
             to the distance value of a vertex is allowed. It takes in three arguments: the current distance
             value of the vertex, the weight of the edge being considered for update, and the current distance
-            value of the vertex at the other
+            value of the vertex at the other. If `None`, every improving update is accepted.
 
         Examples:
             >>> digraph = {
@@ -221,8 +273,11 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
             False
         """
         self.pred = {}
+        scanned: Set[Node] = set()
         found = False
-        while not found and self.relax_pred(dist, get_weight, update_ok):
+        while not found and self._relax_pred_active(
+            dist, get_weight, update_ok, scanned
+        ):
             for vtx in self.find_cycle(self.pred):
                 # Will zero cycle be found???
                 assert self.is_negative(vtx, dist, get_weight)
@@ -233,7 +288,7 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         self,
         dist: MutableMapping[Node, Domain],
         get_weight: Callable[[Edge], Domain],
-        update_ok: Callable[[Domain, Domain], bool],
+        update_ok: Optional[Callable[[Domain, Domain], bool]] = None,
     ) -> Generator[Cycle, None, None]:
         """
         The `howard_succ` function finds negative cycles in a graph and yields a list of cycles.
@@ -251,7 +306,7 @@ class NegCycleFinder(Generic[Node, Edge, Domain]):
         :param update_ok: The `update_ok` parameter is a callable function that determines whether an update
             to the distance value of a vertex is allowed. It takes in three arguments: the current distance
             value of the vertex, the weight of the edge being considered for update, and the current distance
-            value of the vertex at the other
+            value of the vertex at the other. If `None`, every improving update is accepted.
 
         Examples:
             >>> digraph = {
@@ -111,9 +111,10 @@ class MaxParametricSolver(Generic[Node, Edge, Ratio]):
         :return: The function `run` returns a tuple containing the updated ratio (`ratio`) and the cycle (`cycle`).
         """
         D = type(next(iter(dist.values())))
+        distance = self.omega.distance  # bind once per run
 
         def get_weight(e: Edge) -> Domain:
-            return D(self.omega.distance(ratio, e))
+            return D(distance(ratio, e))
 
         r_min = ratio
         c_min = []
@@ -13,6 +13,8 @@ from .test_neg_cycle import (
     create_tiny_graph,
 )
 
+R0 = Fraction(10000, 1)  # initial upper bound of the ratio, shared by all tests
+
 
 def test_cycle_ratio_raw():
     digraph = {
@@ -20,9 +22,9 @@ def test_cycle_ratio_raw():
         "a1": {"a0": {"cost": 0, "time": 1}, "a2": {"cost": 3, "time": 1}},
         "a2": {"a1": {"cost": 1, "time": 1}, "a0": {"cost": 2, "time": 1}},
     }
-    dist = {vtx: 0 for vtx in digraph}
+    dist = dict.fromkeys(digraph, 0)
     solver = MinCycleRatioSolver(digraph)
-    ratio, cycle = solver.run(dist, Fraction(10000, 1))
+    ratio, cycle = solver.run(dist, R0)
     print(ratio)
     print(cycle)
     assert cycle
@@ -34,9 +36,9 @@ def test_cycle_ratio():
     set_default(digraph, "time", 1)
     set_default(digraph, "cost", 1)
     digraph[1][2]["cost"] = 5
-    dist = {vtx: 0 for vtx in digraph}
+    dist = dict.fromkeys(digraph, 0)
     solver = MinCycleRatioSolver(digraph)
-    ratio, cycle = solver.run(dist, Fraction(10000, 1))
+    ratio, cycle = solver.run(dist, R0)
     print(ratio)
     print(cycle)
     assert cycle
@@ -53,9 +55,9 @@ def test_cycle_ratio_timing():
     digraph["a3"]["a1"]["cost"] = 2
     digraph["a1"]["a3"]["cost"] = 4
     # make sure no parallel edges in above!!!
-    dist = {vtx: Fraction(0, 1) for vtx in digraph}
+    dist = dict.fromkeys(digraph, Fraction(0, 1))
     solver = MinCycleRatioSolver(digraph)
-    ratio, cycle = solver.run(dist, Fraction(10000, 1))
+    ratio, cycle = solver.run(dist, R0)
     print(ratio)
     print(cycle)
     assert cycle
@@ -74,7 +76,7 @@ def test_cycle_ratio_tiny_graph():
     # make sure no parallel edges in above!!!
     dist = Lict([0 for _ in range(3)])
     solver = MinCycleRatioSolver(digraph)
-    ratio, cycle = solver.run(dist, Fraction(10000, 1))
+    ratio, cycle = solver.run(dist, R0)
     print(ratio)
     print(cycle)
     assert cycle
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
 
+from array import array
+
 import networkx as nx
 from mywheel.lict import Lict
 
@@ -19,11 +21,7 @@ def test_raw_graph_by_lict():
 
     dist = Lict([0, 0, 0])
     finder = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in finder.howard(dist, lambda edge: edge):
-        has_neg = True
-        break
-    assert not has_neg
+    assert next(finder.howard(dist, lambda edge: edge), None) is None
 
 
 def test_raw_graph_by_dict():
@@ -33,13 +31,24 @@ def test_raw_graph_by_dict():
         "a2": {"a1": 1, "a0": 2},
     }
 
-    dist = {vtx: 0 for vtx in digraph}
+    dist = dict.fromkeys(digraph, 0)
     finder = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in finder.howard(dist, lambda edge: edge):
-        has_neg = True
-        break
-    assert not has_neg
+    assert next(finder.howard(dist, lambda edge: edge), None) is None
+
+
+def test_raw_graph_by_edge_id():
+    digraph = {
+        "a0": {"a1": 0, "a2": 1},
+        "a1": {"a0": 2, "a2": 3},
+        "a2": {"a1": 4, "a0": 5},
+    }
+    weights = [7, 5, -8, 3, 1, 2]  # indexed by edge id
+
+    dist = dict.fromkeys(digraph, 0)
+    finder = NegCycleFinder(digraph)
+    cycles = list(finder.howard(dist, weights.__getitem__))
+    assert cycles
+    assert sum(weights[edge_id] for edge_id in cycles[0]) < 0
 
 
 def create_test_case1():
@@ -111,11 +120,7 @@ def do_case(digraph, dist):
         return edge.get("weight", 1)
 
     ncf = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in ncf.howard(dist, get_weight):
-        has_neg = True
-        break
-    return has_neg
+    return next(ncf.howard(dist, get_weight), None) is not None
 
 
 def test_neg_cycle():
@@ -127,13 +132,55 @@ def test_neg_cycle():
 
 def test_timing_graph():
     digraph = create_test_case_timing()
-    dist = {vtx: 0 for vtx in digraph}
+    dist = dict.fromkeys(digraph, 0)
     has_neg = do_case(digraph, dist)
     assert not has_neg
 
 
 def test_tiny_graph():
     digraph = create_tiny_graph()
-    dist = Lict([0, 0, 0])
+    dist = array("q", [0, 0, 0])
     has_neg = do_case(digraph, dist)
     assert not has_neg
+
+
+def test_active_sweep_matches_full_sweep():
+    digraph = {
+        "a0": {"a1": -3, "a2": 4},
+        "a1": {"a2": -3, "a3": 1},
+        "a2": {"a0": 2, "a3": -2},
+        "a3": {"a0": 1},
+    }
+
+    def get_weight(edge):
+        return edge
+
+    finder = NegCycleFinder(digraph)
+    dist = dict.fromkeys(digraph, 0)
+    cycles = list(finder.howard(dist, get_weight))
+
+    # reference: plain full sweeps with the public relax
+    expected = NegCycleFinder(digraph)
+    expected_dist = dict.fromkeys(digraph, 0)
+    expected_cycles = []
+    while not expected_cycles and expected.relax(expected_dist, get_weight):
+        expected_cycles = [expected.cycle_list(vtx) for vtx in expected.find_cycle()]
+
+    assert cycles
+    assert dist == expected_dist
+    assert finder.pred == expected.pred
+    assert cycles == expected_cycles
+
+
+def test_relax_is_a_full_sweep():
+    digraph = {
+        "a0": {"a1": 1},
+        "a1": {"a2": 1},
+        "a2": {},
+    }
+    finder = NegCycleFinder(digraph)
+    dist = dict.fromkeys(digraph, 0)
+    assert not finder.relax(dist, lambda edge: edge)
+    # new weights, same dist: every node is scanned again
+    assert finder.relax(dist, lambda edge: -edge)
+    assert dist == {"a0": 0, "a1": -1, "a2": -2}
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
 
-import networkx as nx
+from array import array
+
 from mywheel.lict import Lict
 
 from digraphx.neg_cycle_q import NegCycleFinder
-from digraphx.tiny_digraph import DiGraphAdapter, TinyDiGraph
+
+from .test_neg_cycle import (
+    create_test_case1,
+    create_test_case_timing,
+    create_tiny_graph,
+)
 
 
 def test_raw_graph_by_lict():
@@ -22,16 +28,8 @@ def test_raw_graph_by_lict():
 
     dist = Lict([0, 0, 0])
     finder = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in finder.howard_pred(dist, lambda edge: edge, update_ok):
-        has_neg = True
-        break
-    assert not has_neg
-    has_neg = False
-    for _ in finder.howard_succ(dist, lambda edge: edge, update_ok):
-        has_neg = True
-        break
-    assert not has_neg
+    assert next(finder.howard_pred(dist, lambda edge: edge, update_ok), None) is None
+    assert next(finder.howard_succ(dist, lambda edge: edge, update_ok), None) is None
 
 
 def test_raw_graph_by_dict():
@@ -44,145 +42,102 @@ def test_raw_graph_by_dict():
         "a2": {"a1": 1, "a0": 2},
     }
 
-    dist = {vtx: 0 for vtx in digraph}
+    dist = dict.fromkeys(digraph, 0)
     finder = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in finder.howard_pred(dist, lambda edge: edge, update_ok):
-        has_neg = True
-        break
-    assert not has_neg
-    has_neg = False
-    for _ in finder.howard_succ(dist, lambda edge: edge, update_ok):
-        has_neg = True
-        break
-    assert not has_neg
-
-
-def create_test_case1():
-    """[summary]
-
-    Returns:
-        [type]: [description]
-    """
-    digraph = nx.cycle_graph(5, create_using=DiGraphAdapter())
-    digraph[1][2]["weight"] = -5
-    digraph.add_edges_from([(5, n) for n in digraph])
-    return digraph
-
-
-def create_test_case_timing():
-    """[summary]
-
-    Returns:
-        [type]: [description]
-    """
-    digraph = DiGraphAdapter()
-    nodelist = ["a1", "a2", "a3"]
-    digraph.add_nodes_from(nodelist)
-    digraph.add_edges_from(
-        [
-            ("a1", "a2", {"weight": 7}),
-            ("a2", "a1", {"weight": 0}),
-            ("a2", "a3", {"weight": 3}),
-            ("a3", "a2", {"weight": 1}),
-            ("a3", "a1", {"weight": 2}),
-            ("a1", "a3", {"weight": 5}),
-        ]
-    )
-    return digraph
-
-
-def create_tiny_graph():
-    """[summary]
-
-    Returns:
-        [type]: [description]
-    """
-    digraph = TinyDiGraph()
-    digraph.init_nodes(3)
-    digraph.add_edges_from(
-        [
-            (0, 1, {"weight": 7}),
-            (1, 0, {"weight": 0}),
-            (1, 2, {"weight": 3}),
-            (2, 1, {"weight": 1}),
-            (2, 0, {"weight": 2}),
-            (0, 2, {"weight": 5}),
-        ]
-    )
-    return digraph
+    assert next(finder.howard_pred(dist, lambda edge: edge, update_ok), None) is None
+    assert next(finder.howard_succ(dist, lambda edge: edge, update_ok), None) is None
 
 
-def do_case_pred(digraph, dist):
+def do_case_pred(ncf, dist):
     """[summary]
 
     Arguments:
-        digraph ([type]): [description]
+        ncf (NegCycleFinder): finder shared by the pred and succ checks
 
     Returns:
         [type]: [description]
     """
 
-    def update_ok(dist, v):
-        return True
-
     def get_weight(edge):
         return edge.get("weight", 1)
 
-    ncf = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in ncf.howard_pred(dist, get_weight, update_ok):
-        has_neg = True
-        break
-    return has_neg
+    return next(ncf.howard_pred(dist, get_weight), None) is not None
 
 
-def do_case_succ(digraph, dist):
+def do_case_succ(ncf, dist):
     """[summary]
 
     Arguments:
-        digraph ([type]): [description]
+        ncf (NegCycleFinder): finder shared by the pred and succ checks
 
     Returns:
         [type]: [description]
     """
 
-    def update_ok(dist, v):
-        return True
-
     def get_weight(edge):
         return edge.get("weight", 1)
 
-    ncf = NegCycleFinder(digraph)
-    has_neg = False
-    for _ in ncf.howard_succ(dist, get_weight, update_ok):
-        has_neg = True
-        break
-    return has_neg
+    return next(ncf.howard_succ(dist, get_weight), None) is not None
 
 
 def test_neg_cycle():
     digraph = create_test_case1()
+    ncf = NegCycleFinder(digraph)
     dist = list(0 for _ in digraph)
-    has_neg = do_case_pred(digraph, dist)
+    has_neg = do_case_pred(ncf, dist)
     assert has_neg
-    has_neg = do_case_succ(digraph, dist)
+    has_neg = do_case_succ(ncf, dist)
     assert has_neg
 
 
 def test_timing_graph():
     digraph = create_test_case_timing()
-    dist = {vtx: 0 for vtx in digraph}
-    has_neg = do_case_pred(digraph, dist)
+    ncf = NegCycleFinder(digraph)
+    dist = dict.fromkeys(digraph, 0)
+    has_neg = do_case_pred(ncf, dist)
     assert not has_neg
-    has_neg = do_case_succ(digraph, dist)
+    has_neg = do_case_succ(ncf, dist)
     assert not has_neg
 
 
 def test_tiny_graph():
     digraph = create_tiny_graph()
-    dist = Lict([0, 0, 0])
-    has_neg = do_case_pred(digraph, dist)
+    ncf = NegCycleFinder(digraph)
+    dist = array("q", [0, 0, 0])
+    has_neg = do_case_pred(ncf, dist)
     assert not has_neg
-    has_neg = do_case_succ(digraph, dist)
+    has_neg = do_case_succ(ncf, dist)
     assert not has_neg
+
+
+def test_rejected_update_matches_full_sweep():
+    # a0 -> a1 is rejected in the first sweep, but becomes acceptable once
+    # a2 -> a1 has made dist["a1"] negative, so a0 must stay active
+    digraph = {
+        "a0": {"a1": -3},
+        "a1": {},
+        "a2": {"a1": -1},
+    }
+
+    def update_ok(old, new):
+        return old < 0 or new >= -2
+
+    def get_weight(edge):
+        return edge
+
+    finder = NegCycleFinder(digraph)
+    dist = dict.fromkeys(digraph, 0)
+    cycles = list(finder.howard_pred(dist, get_weight, update_ok))
+
+    # reference: plain full sweeps with the public relax_pred
+    expected = NegCycleFinder(digraph)
+    expected_dist = dict.fromkeys(digraph, 0)
+    expected.pred = {}
+    while expected.relax_pred(expected_dist, get_weight, update_ok):
+        pass
+
+    assert expected_dist == {"a0": 0, "a1": -3, "a2": 0}
+    assert expected.pred == {"a1": ("a0", -3)}
+    assert cycles == []
+    assert dist == expected_dist
+    assert finder.pred == expected.pred